@@ -317,3 +317,4 @@ else:
         plt.title("Stability diagram with spiral scan")
         plt.xlabel(x_element + "_scan [V]")
         plt.ylabel(y_element + "_scan [V]")
+        plt.pause(0.1)
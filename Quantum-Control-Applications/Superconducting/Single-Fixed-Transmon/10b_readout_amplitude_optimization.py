@@ -22,6 +22,7 @@ from qualang_tools.results import progress_counter, fetching_tool
 from qualang_tools.analysis import two_state_discriminator
 from qualang_tools.loops import from_array
 import matplotlib.pyplot as plt
+from time import sleep
 
 
 ###################
@@ -122,6 +123,7 @@ else:
         iteration = results.fetch_all()
         # Progress bar
         progress_counter(iteration[0], len(amplitudes), start_time=results.get_start_time())
+        sleep(0.1)
 
     # Fetch the results at the end
     results = fetching_tool(job, data_list=["I_g", "Q_g", "I_e", "Q_e"])
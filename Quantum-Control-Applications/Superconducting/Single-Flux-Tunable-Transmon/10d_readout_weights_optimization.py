@@ -29,6 +29,7 @@ from qm import SimulationConfig
 from configuration import *
 from qualang_tools.results import progress_counter, fetching_tool
 import matplotlib.pyplot as plt
+from time import sleep
 
 
 ####################
@@ -203,6 +204,7 @@ else:
         iteration = results.fetch_all()[0]
         # Progress bar
         progress_counter(iteration, n_avg, start_time=results.get_start_time())
+        sleep(0.1)
 
     # Fetch and reshape the data
     res_handles = job.result_handles
@@ -96,6 +96,7 @@ while results.is_processing():
     plt.pcolor(iters, amps * drag_coef, state, cmap="magma")
     plt.axhline(y=0.01)
     plt.xlabel("drag coef")
+    plt.pause(0.1)
 
 # Close quantum machine
 qm.close()
@@ -4,6 +4,7 @@ from qm import QuantumMachinesManager
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy import signal
+from time import sleep
 
 n_avg = 1000
 
@@ -115,6 +116,7 @@ for j in range(-20, 20):
             percent = 10 * round(iteration / n_avg * 10)  # Round to nearest 10%
             print(f"{percent}%", end=" ")
             next_percent = percent / 100 + 0.1  # Print every 10%
+        sleep(0.1)
 
     plt.cla()
     I = I_handle.fetch_all()
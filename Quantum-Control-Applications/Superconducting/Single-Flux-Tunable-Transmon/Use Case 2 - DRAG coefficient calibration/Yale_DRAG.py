@@ -113,6 +113,7 @@ while results.is_processing():
     plt.plot(amps * drag_coef, state2, label="y180x90")
     plt.xlabel("drag coef")
     plt.legend()
+    plt.pause(0.1)
 
 # Close quantum machine
 qm.close()
@@ -198,6 +198,7 @@ while results.is_processing():
     plt.plot(value)
     plt.xlabel("Number of cliffords")
     plt.ylabel("Sequence Fidelity")
+    plt.pause(0.1)
 
 
 def power_law(m, a, b, p):
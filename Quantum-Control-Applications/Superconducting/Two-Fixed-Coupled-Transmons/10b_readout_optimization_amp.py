@@ -24,6 +24,7 @@ from qualang_tools.results import fetching_tool, progress_counter
 from macros import multiplexed_readout, qua_declaration
 from qualang_tools.results.data_handler import DataHandler
 from qualang_tools.analysis import two_state_discriminator
+from time import sleep
 
 ##################
 #   Parameters   #
@@ -113,6 +114,7 @@ else:
             iteration = results.fetch_all()
             # Progress bar
             progress_counter(iteration[0], len(scalings), start_time=results.get_start_time())
+            sleep(0.1)
 
         # Fetch the results at the end
         results = fetching_tool(job, ["I_g_q0", "Q_g_q0", "I_e_q0", "Q_e_q0", "I_g_q1", "Q_g_q1", "I_e_q1", "Q_e_q1"])
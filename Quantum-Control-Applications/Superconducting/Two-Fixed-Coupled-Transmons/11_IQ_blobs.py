@@ -26,6 +26,7 @@ from macros import qua_declaration, multiplexed_readout, active_reset
 from qualang_tools.results import progress_counter
 from qualang_tools.results.data_handler import DataHandler
 from qualang_tools.analysis import two_state_discriminator
+from time import sleep
 
 ##################
 #   Parameters   #
@@ -105,6 +106,7 @@ else:
         while results.is_processing():
             iteration = results.fetch_all()
             progress_counter(iteration[0], n_runs, start_time=results.start_time)
+            sleep(0.1)
 
         # fetch data
         results = fetching_tool(job, ["I_g_q0", "Q_g_q0", "I_e_q0", "Q_e_q0", "I_g_q1", "Q_g_q1", "I_e_q1", "Q_e_q1"])
@@ -52,6 +52,7 @@ from qualang_tools.results import progress_counter
 from macros import qua_declaration, multiplexed_readout, active_reset
 from qualang_tools.results.data_handler import DataHandler
 from macros import qua_declaration, multiplexed_readout
+from time import sleep
 from cr_hamiltonian_tomography import (
     CRHamiltonianTomographyAnalysis,
     plot_cr_duration_vs_scan_param,
@@ -247,6 +248,7 @@ else:
             bloch_c, bloch_t = -2 * state_c + 1, -2 * state_t + 1  # convert |0> -> 1, |1> -> -1
             # Progress bar
             progress_counter(iterations, n_avg, start_time=results.start_time)
+            sleep(0.1)
 
         # plotting data
         fig = plot_cr_duration_vs_scan_param(bloch_c, bloch_t, ts_ns, amp_scalings, "cr cancel amplitude", axss)
@@ -25,6 +25,7 @@ from macros import qua_declaration, multiplexed_readout
 from qualang_tools.results.data_handler import DataHandler
 from macros import qua_declaration, multiplexed_readout
 import pandas as pd
+from time import sleep
 
 
 ##################
@@ -190,6 +191,7 @@ else:
             # Convert the results into Volts
             I1, Q1 = u.demod2volts(I1, readout_len), u.demod2volts(Q1, readout_len)
             I2, Q2 = u.demod2volts(I2, readout_len), u.demod2volts(Q2, readout_len)
+            sleep(0.1)
 
         # Save data
         save_data_dict.update({"fig_live": fig})
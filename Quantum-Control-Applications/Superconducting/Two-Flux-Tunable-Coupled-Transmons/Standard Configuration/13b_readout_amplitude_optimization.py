@@ -24,6 +24,7 @@ from qualang_tools.loops import from_array
 from qualang_tools.results import fetching_tool, progress_counter
 from qualang_tools.analysis import two_state_discriminator
 from macros import multiplexed_readout, qua_declaration
+from time import sleep
 
 
 ###################
@@ -104,6 +105,7 @@ else:
         iteration = results.fetch_all()
         # Progress bar
         progress_counter(iteration[0], len(amplitudes), start_time=results.get_start_time())
+        sleep(0.1)
 
     # Fetch the results at the end
     results = fetching_tool(job, ["I_g_q0", "Q_g_q0", "I_e_q0", "Q_e_q0", "I_g_q1", "Q_g_q1", "I_e_q1", "Q_e_q1"])
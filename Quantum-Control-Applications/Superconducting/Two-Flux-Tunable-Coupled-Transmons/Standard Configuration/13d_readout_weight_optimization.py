@@ -30,6 +30,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from qm import SimulationConfig
 from qualang_tools.results import fetching_tool, progress_counter
+from time import sleep
 
 
 ###########
@@ -200,6 +201,7 @@ else:
         iteration = results.fetch_all()[0]
         # Progress bar
         progress_counter(iteration, n_avg, start_time=results.get_start_time())
+        sleep(0.1)
 
     # Fetch and reshape the data
     ground_trace = [[], []]
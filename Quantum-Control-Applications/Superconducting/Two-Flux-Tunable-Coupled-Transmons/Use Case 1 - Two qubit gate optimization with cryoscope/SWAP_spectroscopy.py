@@ -140,3 +140,4 @@ while results.is_processing():
     plt.xlabel("Flux pulse time [ns]")
     plt.ylabel("Flux voltage wrt sweet spot [V]")
     plt.title("02-11 conditional on q1, measurement on q0")
+    plt.pause(0.1)
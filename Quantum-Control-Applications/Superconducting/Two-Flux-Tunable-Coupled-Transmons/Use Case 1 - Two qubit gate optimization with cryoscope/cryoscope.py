@@ -172,6 +172,7 @@ while results.is_processing():
     plt.xlabel("Flux pulse duration [ns]")
     plt.ylabel("Qubit detuning [MHz]")
     plt.legend()
+    plt.pause(0.1)
 
 
 ## Fit step response with exponential
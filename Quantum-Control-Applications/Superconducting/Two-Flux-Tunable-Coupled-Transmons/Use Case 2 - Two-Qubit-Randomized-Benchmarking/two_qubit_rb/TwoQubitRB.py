@@ -99,6 +99,7 @@ class TwoQubitRb:
         self._prep_func = prep_func
         self._measure_func = measure_func
         self._verify_generation = verify_generation
+        self._input_stream_error = None
 
     def convert_sequence_to_cirq(self, sequence: List[int]) -> List[cirq.GateOperation]:
         gates = []
@@ -195,8 +196,6 @@ class TwoQubitRb:
 
     def _decode_sequence_for_element(self, element: str, seq: list):
         seq = [self._rb_baker.decode(i, element) for i in seq]
-        if len(seq) > self._buffer_length:
-            RuntimeError("Buffer is too small")
         return seq + [0] * (self._buffer_length - len(seq))
 
     @run_in_thread
@@ -210,6 +209,13 @@ class TwoQubitRb:
         for sequence_depth in sequence_depths:
             for repeat in range(num_repeats):
                 sequence = self._gen_rb_sequence(sequence_depth)
+                if len(sequence) > self._buffer_length:
+                    # This runs in a worker thread: halt the job so that `run` stops waiting, and let it re-raise
+                    self._input_stream_error = RuntimeError(
+                        f"Buffer is too small: sequence has {len(sequence)} commands, buffer holds {self._buffer_length}"
+                    )
+                    job.halt()
+                    return
                 if self._sequence_tracker is not None:
                     self._sequence_tracker.make_sequence(sequence)
                 job.insert_input_stream("__gates_len_is__", len(sequence))
@@ -246,11 +252,14 @@ class TwoQubitRb:
         job = qm.execute(prog)
 
         gen_sequence_callback = kwargs["gen_sequence_callback"] if "gen_sequence_callback" in kwargs else None
+        self._input_stream_error = None
         self._insert_all_input_stream(job, circuit_depths, num_circuits_per_depth, gen_sequence_callback)
 
         full_progress = len(circuit_depths) * num_circuits_per_depth
         pbar(job.result_handles, full_progress, "progress")
         job.result_handles.wait_for_all_values()
+        if self._input_stream_error is not None:
+            raise self._input_stream_error
 
         return RBResult(
             circuit_depths=circuit_depths,
@@ -1,4 +1,5 @@
 import os
+import time
 from qualang_tools.bakery.bakery import Baking
 from configuration import *
 from .. import TwoQubitRb
@@ -55,5 +56,83 @@ def test_all_verification():
         rb.verify_sequences()
 
 
+def test_run_fails_on_buffer_overflow():
+    """
+    Tests that a sequence longer than the input stream buffer halts the job
+    and makes `run` raise, instead of leaving it waiting for results forever.
+    """
+
+    class FakeResultHandles:
+        def __init__(self):
+            self.processing = True
+
+        def get(self, name):
+            return self
+
+        def fetch_all(self):
+            # nothing is saved to the progress stream before the job is halted
+            return None if self.processing else 0
+
+        def is_processing(self):
+            return self.processing
+
+        def wait_for_all_values(self):
+            while self.processing:
+                time.sleep(0.01)
+
+    class FakeJob:
+        def __init__(self):
+            self.result_handles = FakeResultHandles()
+            self.halted = False
+
+        def insert_input_stream(self, name, data):
+            pass
+
+        def halt(self):
+            self.halted = True
+            self.result_handles.processing = False
+
+    class FakeQm:
+        def __init__(self):
+            self.job = None
+
+        def execute(self, prog):
+            self.job = FakeJob()
+            return self.job
+
+    class FakeQmm:
+        def __init__(self):
+            self.qm = FakeQm()
+
+        def open_qm(self, config):
+            return self.qm
+
+    def bake_phased_xz(baker: Baking, q, x, z, a):
+        pass
+
+    def bake_cz(baker: Baking, q1, q2):
+        pass
+
+    def prep():
+        pass
+
+    def meas():
+        pass
+
+    rb = TwoQubitRb(config, bake_phased_xz, {"CZ": bake_cz}, prep, meas, verify_generation=False)
+    # a depth-10 sequence has 22 commands, which does not fit in an 8-command buffer
+    rb._buffer_length = 8
+    qmm = FakeQmm()
+    # the job is halted on the first sequence, so progress never reaches the 2 circuits `run` waits for
+    try:
+        rb.run(qmm, circuit_depths=[10], num_circuits_per_depth=2, num_shots_per_circuit=1)
+    except RuntimeError as e:
+        assert "Buffer is too small" in str(e)
+    else:
+        raise AssertionError("run did not fail on a sequence longer than the input stream buffer")
+    assert qmm.qm.job.halted, "the job was not halted on a sequence longer than the input stream buffer"
+
+
 if __name__ == "__main__":
     test_all_verification()
+    test_run_fails_on_buffer_overflow()
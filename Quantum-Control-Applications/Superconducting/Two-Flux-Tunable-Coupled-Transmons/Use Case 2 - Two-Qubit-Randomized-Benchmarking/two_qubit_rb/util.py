@@ -20,15 +20,23 @@ def pbar(res_handles, n_avg, n_label, timeout=10, return_times=False):
         if m * 0.1 > timeout:
             print("reached timeout")
             break
+        if not res_handles.is_processing():
+            break
         sleep(0.1)
+        m += 1
         n = res_handles.get(n_label).fetch_all()
+    if n is None:
+        n = 0
 
     times_vec = []
     with tqdm(total=n_avg, desc=n_label) as pbar_obj:
-        while n < n_avg:
-            n = res_handles.get(n_label).fetch_all() + 1
+        while n < n_avg and res_handles.is_processing():
+            fetched = res_handles.get(n_label).fetch_all()
             sleep(0.1)
-            if n is not None and n > n_now:
+            if fetched is None:
+                continue
+            n = fetched + 1
+            if n > n_now:
                 pbar_obj.update(n - n_now)
                 n_now = n
                 if return_times:
@@ -46,6 +46,7 @@ from qualang_tools.results import progress_counter, fetching_tool
 import numpy as np
 from scipy.linalg import solve
 
+from time import sleep
 from helper_functions import (
     P_Pauli1,
     plot_process_tomography1,
@@ -212,6 +213,7 @@ else:
 
         # Progress bar
         progress_counter(iteration, n_avg, start_time=results.get_start_time())
+        sleep(0.1)
 
     # Close the quantum machines at the end in order to put all flux biases to 0 so that the fridge doesn't heat-up
     qm.close()
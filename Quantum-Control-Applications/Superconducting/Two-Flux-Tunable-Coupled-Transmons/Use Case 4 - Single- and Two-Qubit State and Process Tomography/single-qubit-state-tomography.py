@@ -34,6 +34,7 @@ from qm import SimulationConfig
 from configuration import *
 from qualang_tools.results import progress_counter, fetching_tool
 import numpy as np
+from time import sleep
 
 
 ###################
@@ -160,6 +161,7 @@ else:
         # assignment, to (1,-1) -> |g>,|e>, which aligns with the Stokes parameter
         # definitions from the projector probabilities
         prob = -2 * (probs - 0.5)
+        sleep(0.1)
 
     # Close the quantum machines at the end in order to put all flux biases to 0 so that the fridge doesn't heat-up
     qm.close()
@@ -49,6 +49,7 @@ from scipy.linalg import solve
 import os
 import pickle
 
+from time import sleep
 from helper_functions import (
     P_Pauli2,
     plot_process_tomography2,
@@ -314,6 +315,7 @@ else:
 
         # Progress bar
         progress_counter(iteration, n_avg, start_time=results.get_start_time())
+        sleep(0.1)
 
     # Close the quantum machines at the end in order to put all flux biases to 0 so that the fridge doesn't heat-up
     qm.close()
@@ -37,6 +37,7 @@ from configuration import *
 from qualang_tools.results import progress_counter, fetching_tool
 
 from helper_functions import rotated_multiplexed_state_discrimination
+from time import sleep
 
 
 ###################
@@ -276,6 +277,7 @@ else:
 
         # Progress bar
         progress_counter(iteration, n_avg, start_time=results.get_start_time())
+        sleep(0.1)
 
     # Close the quantum machines at the end in order to put all flux biases to
     # 0 so that the fridge doesn't heat-up